@@ -9,7 +9,30 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
+import functools
 import json
+import re
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional — fall back to plain Python
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to stdlib json
+    orjson = None
+
+
+def dump_json(obj, path):
+    """Serialize obj to path, preferring orjson's C-level writer."""
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
 
 # Configuration
 ASTRO_DIR = Path("~/Dev/Workspaces/Dec-2025/4castr/csv-pull/market-data/data/astro").expanduser()
@@ -87,11 +110,139 @@ ASPECT_SCORES = {
     }
 }
 
+# Pre-hash the membership sets once — hot paths only ever test membership,
+# and pandas isin accepts sets directly
+for _sector_info in SECTOR_RULERSHIPS.values():
+    _sector_info['rulers'] = frozenset(_sector_info['rulers'])
+    _sector_info['favorable_signs'] = frozenset(_sector_info['favorable_signs'])
+
+# Keyword matching compiled once: a single regex alternation scans a symbol
+# in one pass instead of testing every sector's keyword list individually
+KEYWORD_TO_SECTOR = {
+    keyword: sector
+    for sector, data in SECTOR_RULERSHIPS.items()
+    for keyword in data['keywords']
+}
+KEYWORD_RE = re.compile('(' + '|'.join(map(re.escape, KEYWORD_TO_SECTOR)) + ')')
+
+# Default sector when no keyword matches
+CATEGORY_DEFAULT_SECTORS = {
+    'crypto': 'tech',
+    'forex': 'finance',
+    'rates-macro': 'finance',
+    'stress': 'finance',
+    'commodities': 'real_estate',  # General tangible assets
+    'equities': None  # Will need individual analysis
+}
+
+# Element-based fallback score per sign, flattened to one hash lookup:
+# fire = active, earth = stability, air = movement, water = volatile
+SIGN_DEFAULT_SCORES = {
+    **dict.fromkeys(['Aries', 'Leo', 'Sagittarius'], 22),
+    **dict.fromkeys(['Taurus', 'Virgo', 'Capricorn'], 20),
+    **dict.fromkeys(['Gemini', 'Libra', 'Aquarius'], 18),
+    **dict.fromkeys(['Cancer', 'Scorpio', 'Pisces'], 12)
+}
+
+# Flat (nature, type) -> base score lookup for vectorized aspect scoring
+ASPECT_LOOKUP = pd.Series({
+    (nature, aspect_type): points
+    for nature, table in ASPECT_SCORES.items()
+    for aspect_type, points in table.items()
+})
+
+
+def _reduce_aspects(base_scores, ruler_mask):
+    """Sum aspect base scores, amplifying ruler-involved aspects by 1.5x."""
+    total = 0.0
+    for i in range(base_scores.size):
+        value = base_scores[i]
+        if ruler_mask[i]:
+            value *= 1.5
+        total += value
+    return total
+
+
+if njit is not None:
+    # JIT-compile the hot reduction; cache=True persists the compiled kernel
+    _reduce_aspects = njit(cache=True, fastmath=True)(_reduce_aspects)
+
+
+# Column subsets and dtypes per astro file: only the columns the scorers
+# read are loaded, and categorical strings turn the isin/equality filters
+# into integer-code compares at a fraction of the memory
+ASTRO_READ_OPTIONS = {
+    'aspects': {
+        'usecols': ['date', 'body1', 'body2', 'aspect_type', 'aspect_nature',
+                    'primary_scoring', 'bonus_eligible', 'exact', 'influence_weight'],
+        'dtype': {
+            'body1': 'category', 'body2': 'category',
+            'aspect_type': 'category', 'aspect_nature': 'category',
+            'primary_scoring': 'boolean', 'bonus_eligible': 'boolean',
+            'exact': 'boolean', 'influence_weight': 'float32'
+        }
+    },
+    'ingresses': {
+        'usecols': ['date', 'body', 'sign'],
+        'dtype': {'body': 'category', 'sign': 'category'}
+    },
+    'lunar_phases': {
+        'usecols': ['date', 'phase'],
+        'dtype': {'phase': 'category'}
+    },
+    'retrogrades': {
+        'usecols': ['date', 'body', 'status'],
+        'dtype': {'body': 'category', 'status': 'category'}
+    },
+    'lunar_cycle': {
+        'usecols': ['date', 'bonus_eligible'],
+        'dtype': {'bonus_eligible': 'boolean'}
+    }
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_astro_frame(key, path_str, mtime_ns):
+    """
+    Load one astro events file as a cleaned, date-sorted DataFrame.
+
+    A Parquet sidecar is written on first load and preferred on later
+    runs (no re-parsing of dates); mtime_ns keys the in-process cache so
+    a refreshed CSV invalidates both layers.
+    """
+    path = Path(path_str)
+    parquet_path = path.with_suffix('.parquet')
+
+    if parquet_path.exists() and parquet_path.stat().st_mtime_ns >= mtime_ns:
+        return pd.read_parquet(parquet_path)
+
+    options = ASTRO_READ_OPTIONS.get(key)
+    if options:
+        wanted = frozenset(options['usecols'])
+        df = pd.read_csv(
+            path,
+            usecols=lambda col: col in wanted,
+            dtype=options['dtype'],
+            parse_dates=['date']
+        )
+    else:
+        df = pd.read_csv(path, parse_dates=['date'])
+
+    # Sort once so date lookups can binary-search instead of masking
+    df = df.sort_values('date').reset_index(drop=True)
+
+    try:
+        df.to_parquet(parquet_path, engine='pyarrow')
+    except ImportError:
+        pass  # pyarrow not installed — reload from CSV next run
+
+    return df
+
 
 def load_astro_data():
     """Load all astrological event data."""
     data = {}
-    
+
     files = {
         'aspects': 'aspects.csv',
         'ingresses': 'ingresses.csv',
@@ -99,173 +250,195 @@ def load_astro_data():
         'retrogrades': 'retrogrades.csv',
         'lunar_cycle': 'lunar_cycle_18yr.csv'
     }
-    
+
     for key, filename in files.items():
         path = ASTRO_DIR / filename
         if path.exists():
-            df = pd.read_csv(path)
-            df['date'] = pd.to_datetime(df['date'])
+            df = _load_astro_frame(key, str(path), path.stat().st_mtime_ns)
             data[key] = df
+            data[key + '_dates'] = df['date'].values.astype('datetime64[D]')
         else:
             print(f"⚠️  Warning: {filename} not found")
             data[key] = pd.DataFrame()
-    
+            data[key + '_dates'] = np.array([], dtype='datetime64[D]')
+
     return data
 
 
+def _window_slice(df, dates, start_date, end_date):
+    """Slice a date-sorted frame to [start_date, end_date] via searchsorted."""
+    lo = np.searchsorted(dates, np.datetime64(start_date, 'D'), side='left')
+    hi = np.searchsorted(dates, np.datetime64(end_date, 'D'), side='right')
+    return df.iloc[lo:hi]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_fibonacci_json(path_str, mtime_ns):
+    """Parse the Fibonacci JSON once per file version within a process."""
+    with open(path_str, 'r') as f:
+        return json.load(f)
+
+
 def load_fibonacci_data():
     """Load Fibonacci levels for all symbols."""
     json_path = FIBONACCI_DIR / 'fibonacci_levels.json'
-    
+
     if not json_path.exists():
         print("❌ Fibonacci data not found!")
         return []
-    
-    with open(json_path, 'r') as f:
-        return json.load(f)
+
+    return _load_fibonacci_json(str(json_path), json_path.stat().st_mtime_ns)
 
 
 def identify_sector(symbol, category):
     """Identify which sector a symbol belongs to."""
-    symbol_lower = symbol.lower()
-    
-    # Check against keywords
-    for sector, data in SECTOR_RULERSHIPS.items():
-        for keyword in data['keywords']:
-            if keyword in symbol_lower:
-                return sector
-    
+    # One linear scan against the compiled keyword alternation
+    match = KEYWORD_RE.search(symbol.lower())
+    if match:
+        return KEYWORD_TO_SECTOR[match.group(1)]
+
     # Default sector based on category
-    category_defaults = {
-        'crypto': 'tech',
-        'forex': 'finance',
-        'rates-macro': 'finance',
-        'stress': 'finance',
-        'commodities': 'real_estate',  # General tangible assets
-        'equities': None  # Will need individual analysis
+    return CATEGORY_DEFAULT_SECTORS.get(category, None)
+
+
+def precompute_date_context(current_date, astro_data):
+    """
+    Precompute the date-dependent lookups shared by every sector.
+
+    The current Sun sign, lunar phase score, cycle bonus, and the ±3 day
+    aspect/retrograde windows are identical for all sectors scored on one
+    date, so they are resolved here exactly once per run.
+    """
+    context = {
+        'current_sign': None,
+        'lunar_score': score_lunar_phase(
+            current_date, astro_data['lunar_phases'], astro_data['lunar_phases_dates']
+        ),
+        'cycle_bonus': score_18yr_lunar_cycle(
+            current_date, astro_data['lunar_cycle'], astro_data['lunar_cycle_dates']
+        ),
+        'aspect_window': pd.DataFrame(),
+        'retro_window': pd.DataFrame()
     }
-    
-    return category_defaults.get(category, None)
+
+    # Find the current ingress period (most recent Sun ingress) with a
+    # binary search on the presorted date array
+    ingresses_df = astro_data['ingresses']
+    if not ingresses_df.empty:
+        sun_ingresses = ingresses_df[ingresses_df['body'] == 'Sun']
+        sun_dates = sun_ingresses['date'].values.astype('datetime64[D]')
+        idx = np.searchsorted(sun_dates, np.datetime64(current_date, 'D'), side='right') - 1
+        if idx >= 0:
+            context['current_sign'] = sun_ingresses.iloc[idx]['sign']
+
+    # Aspects and retrograde stations within ±3 days
+    start_date = current_date - timedelta(days=3)
+    end_date = current_date + timedelta(days=3)
+
+    if not astro_data['aspects'].empty:
+        context['aspect_window'] = _window_slice(
+            astro_data['aspects'], astro_data['aspects_dates'],
+            start_date, end_date
+        )
+
+    if not astro_data['retrogrades'].empty:
+        retro_window = _window_slice(
+            astro_data['retrogrades'], astro_data['retrogrades_dates'],
+            start_date, end_date
+        )
+        context['retro_window'] = retro_window[retro_window['status'] == 'starts']
+
+    return context
 
 
-def score_ingress_period(current_date, ingresses_df, sector_info):
+def score_ingress_period(current_sign, sector_info):
     """
     Score the current ingress period (like hours on a clock).
     Returns score 0-30 based on how favorable the current sign period is.
     """
-    if ingresses_df.empty or not sector_info:
+    if current_sign is None or not sector_info:
         return 15  # Neutral
-    
-    # Find the current ingress period (most recent Sun ingress)
-    sun_ingresses = ingresses_df[ingresses_df['body'] == 'Sun'].copy()
-    sun_ingresses = sun_ingresses[sun_ingresses['date'] <= current_date]
-    
-    if sun_ingresses.empty:
-        return 15
-    
-    current_ingress = sun_ingresses.iloc[-1]
-    current_sign = current_ingress['sign']
-    
+
     # Check if current sign is favorable for this sector
     favorable_signs = sector_info.get('favorable_signs', [])
-    
+
     if current_sign in favorable_signs:
         return 30  # Highly favorable
-    elif current_sign in ['Aries', 'Leo', 'Sagittarius']:  # Fire signs - generally active
-        return 22
-    elif current_sign in ['Taurus', 'Virgo', 'Capricorn']:  # Earth signs - stability
-        return 20
-    elif current_sign in ['Gemini', 'Libra', 'Aquarius']:  # Air signs - movement
-        return 18
-    else:  # Water signs - emotional/volatile
-        return 12
 
+    # Otherwise score by the sign's element
+    return SIGN_DEFAULT_SCORES.get(current_sign, 12)
 
-def score_planetary_aspects(current_date, aspects_df, retrogrades_df, sector_info):
+
+def score_planetary_aspects(active_aspects, active_retrogrades, sector_info):
     """
-    Score planetary aspects within a ±3 day window.
+    Score planetary aspects within the precomputed ±3 day window.
     Returns score 0-40 based on aspect quality and planetary alignment.
     """
-    if aspects_df.empty or not sector_info:
+    if active_aspects.empty or not sector_info:
         return 20  # Neutral
     
-    # Get aspects within ±3 days
-    start_date = current_date - timedelta(days=3)
-    end_date = current_date + timedelta(days=3)
-    
-    active_aspects = aspects_df[
-        (aspects_df['date'] >= start_date) & 
-        (aspects_df['date'] <= end_date)
-    ]
-    
-    if active_aspects.empty:
-        return 20
-    
     score = 20  # Start neutral
     sector_rulers = sector_info.get('rulers', [])
-    
-    # Score primary aspects
+
+    # Score primary aspects as one vectorized reduction
     primary_aspects = active_aspects[active_aspects.get('primary_scoring', True) == True]
-    
-    for _, aspect in primary_aspects.iterrows():
-        body1 = aspect['body1']
-        body2 = aspect['body2']
-        aspect_type = aspect['aspect_type']
-        aspect_nature = aspect['aspect_nature']
-        
-        # Check if sector rulers are involved
-        ruler_involved = body1 in sector_rulers or body2 in sector_rulers
-        
-        # Get base score for aspect
-        if aspect_nature == 'harmonious':
-            base_score = ASPECT_SCORES['harmonious'].get(aspect_type, 0)
-        else:
-            base_score = ASPECT_SCORES['harsh'].get(aspect_type, 0)
-        
-        # Amplify if ruler is involved
-        if ruler_involved:
-            base_score *= 1.5
-        
-        score += base_score
-    
+
+    if not primary_aspects.empty:
+        # Map (nature, type) to base scores in one pass
+        keys = pd.MultiIndex.from_arrays([
+            primary_aspects['aspect_nature'],
+            primary_aspects['aspect_type']
+        ])
+        base = keys.map(ASPECT_LOOKUP).fillna(0).to_numpy(dtype=np.float64)
+
+        # Amplify aspects that involve a sector ruler
+        ruler_mask = (
+            primary_aspects['body1'].isin(sector_rulers) |
+            primary_aspects['body2'].isin(sector_rulers)
+        ).to_numpy()
+
+        score += _reduce_aspects(base, ruler_mask)
+
     # Check for retrograde rulers (reduces score)
-    if not retrogrades_df.empty:
-        active_retrogrades = retrogrades_df[
-            (retrogrades_df['date'] >= start_date) & 
-            (retrogrades_df['date'] <= end_date) &
-            (retrogrades_df['status'] == 'starts')
+    if not active_retrogrades.empty:
+        # Penalty for each ruler going retrograde
+        score -= 10 * active_retrogrades['body'].isin(sector_rulers).sum()
+
+    # Add bonus points for exact outer planet aspects (the flag column is
+    # null for primary rows, so treat missing as False)
+    if 'bonus_eligible' in active_aspects.columns:
+        bonus_aspects = active_aspects[
+            active_aspects['bonus_eligible'].fillna(False).astype(bool)
         ]
-        
-        for _, rx in active_retrogrades.iterrows():
-            if rx['body'] in sector_rulers:
-                score -= 10  # Penalty for ruler going retrograde
-    
-    # Add bonus points for exact outer planet aspects
-    bonus_aspects = active_aspects[active_aspects.get('bonus_eligible', False) == True]
-    for _, bonus in bonus_aspects.iterrows():
-        if bonus.get('exact', False):
-            influence = bonus.get('influence_weight', 85)
-            score += (influence / 100) * 5  # Small bonus (max +5)
-    
+    else:
+        bonus_aspects = pd.DataFrame()
+    if not bonus_aspects.empty and 'exact' in bonus_aspects.columns:
+        exact_mask = bonus_aspects['exact'].fillna(False).astype(bool).to_numpy()
+        if 'influence_weight' in bonus_aspects.columns:
+            influence = bonus_aspects['influence_weight'].fillna(85).to_numpy(dtype=np.float64)
+        else:
+            influence = np.full(len(bonus_aspects), 85.0)
+        # Small bonus (max +5 each)
+        score += ((influence / 100) * 5)[exact_mask].sum()
+
     return max(0, min(40, score))  # Clamp to 0-40
 
 
-def score_lunar_phase(current_date, lunar_phases_df):
+def score_lunar_phase(current_date, lunar_phases_df, phase_dates):
     """
     Score the lunar phase (precision timing).
     Returns score 0-20 based on lunar phase favorability.
     """
     if lunar_phases_df.empty:
         return 10  # Neutral
-    
-    # Find current lunar phase
-    phases_before = lunar_phases_df[lunar_phases_df['date'] <= current_date]
-    
-    if phases_before.empty:
+
+    # Find current lunar phase (most recent row on or before current_date)
+    idx = np.searchsorted(phase_dates, np.datetime64(current_date, 'D'), side='right') - 1
+
+    if idx < 0:
         return 10
-    
-    current_phase_row = phases_before.iloc[-1]
-    current_phase = current_phase_row['phase']
+
+    current_phase = lunar_phases_df['phase'].iloc[idx]
     
     # Score based on phase
     phase_scores = {
@@ -282,20 +455,21 @@ def score_lunar_phase(current_date, lunar_phases_df):
     return phase_scores.get(current_phase, 10)
 
 
-def score_18yr_lunar_cycle(current_date, lunar_cycle_df):
+def score_18yr_lunar_cycle(current_date, lunar_cycle_df, cycle_dates):
     """
     Score the 18.6-year lunar cycle bonus (power-up).
     Returns 0-10 bonus points for being near critical cycle points.
     """
     if lunar_cycle_df.empty:
         return 0
-    
+
     # Check if we're at a bonus-eligible cycle point
-    active_cycles = lunar_cycle_df[
-        (lunar_cycle_df['date'] >= current_date - timedelta(days=30)) &
-        (lunar_cycle_df['date'] <= current_date + timedelta(days=30))
-    ]
-    
+    active_cycles = _window_slice(
+        lunar_cycle_df, cycle_dates,
+        current_date - timedelta(days=30),
+        current_date + timedelta(days=30)
+    )
+
     bonus_cycles = active_cycles[active_cycles.get('bonus_eligible', False) == True]
     
     if not bonus_cycles.empty:
@@ -305,56 +479,40 @@ def score_18yr_lunar_cycle(current_date, lunar_cycle_df):
     return 0
 
 
-def calculate_confidence_score(symbol_data, astro_data, current_date=None):
+def score_sector(sector, context):
     """
-    Calculate overall confidence score for a symbol.
-    
+    Calculate the confidence score components for a sector on a date.
+
+    Every component depends only on (sector, date), so this runs once per
+    distinct sector against the precomputed date context and the result is
+    shared by all symbols in that sector.
+
     Score components:
     - Ingress Period: 0-30 (general timing)
     - Planetary Aspects: 0-40 (specific alignments)
     - Lunar Phase: 0-20 (precision timing)
     - 18.6yr Cycle Bonus: 0-10 (power-up)
-    
+
     Total: 0-100+ (can exceed 100 with bonuses)
     """
-    if current_date is None:
-        current_date = datetime.now()
-    
-    symbol = symbol_data['symbol']
-    category = symbol_data['category']
-    
-    # Identify sector
-    sector = identify_sector(symbol, category)
     sector_info = SECTOR_RULERSHIPS.get(sector) if sector else None
-    
+
     # Calculate component scores
-    ingress_score = score_ingress_period(
-        current_date,
-        astro_data['ingresses'],
-        sector_info
-    )
-    
+    ingress_score = score_ingress_period(context['current_sign'], sector_info)
+
     aspects_score = score_planetary_aspects(
-        current_date,
-        astro_data['aspects'],
-        astro_data['retrogrades'],
+        context['aspect_window'],
+        context['retro_window'],
         sector_info
     )
-    
-    lunar_score = score_lunar_phase(
-        current_date,
-        astro_data['lunar_phases']
-    )
-    
-    cycle_bonus = score_18yr_lunar_cycle(
-        current_date,
-        astro_data['lunar_cycle']
-    )
-    
+
+    lunar_score = context['lunar_score']
+    cycle_bonus = context['cycle_bonus']
+
     # Calculate total
     base_score = ingress_score + aspects_score + lunar_score
     total_score = base_score + cycle_bonus
-    
+
     # Determine rating
     if total_score >= FEATURED_THRESHOLD:
         rating = 'featured'
@@ -364,12 +522,8 @@ def calculate_confidence_score(symbol_data, astro_data, current_date=None):
         rating = 'neutral'
     else:
         rating = 'unfavorable'
-    
+
     return {
-        'symbol': symbol,
-        'category': category,
-        'sector': sector,
-        'date': current_date.strftime('%Y-%m-%d'),
         'total_score': round(total_score, 2),
         'base_score': round(base_score, 2),
         'rating': rating,
@@ -403,13 +557,35 @@ def main():
     current_date = datetime.now()
     print(f"\n📅 Calculating scores for: {current_date.strftime('%Y-%m-%d')}")
     
+    # Build a symbols frame and resolve each symbol's sector up front
+    symbols_df = pd.DataFrame(fibonacci_data)[['symbol', 'category']]
+    symbols_df['sector'] = [
+        identify_sector(symbol, category)
+        for symbol, category in zip(symbols_df['symbol'], symbols_df['category'])
+    ]
+
+    # Scores depend only on (sector, date) — resolve the shared date context
+    # once, then score each distinct sector and broadcast across its symbols
+    context = precompute_date_context(current_date, astro_data)
+    sector_scores = {
+        sector: score_sector(sector, context)
+        for sector in symbols_df['sector'].unique()
+    }
+
+    date_str = current_date.strftime('%Y-%m-%d')
     all_scores = []
     featured_symbols = []
-    
-    for symbol_data in fibonacci_data:
-        score_result = calculate_confidence_score(symbol_data, astro_data, current_date)
+
+    for symbol, category, sector in symbols_df.itertuples(index=False):
+        score_result = {
+            'symbol': symbol,
+            'category': category,
+            'sector': sector,
+            'date': date_str,
+            **sector_scores[sector]
+        }
         all_scores.append(score_result)
-        
+
         if score_result['is_featured']:
             featured_symbols.append(score_result)
     
@@ -421,18 +597,23 @@ def main():
     
     # Current scores
     scores_file = OUTPUT_DIR / f"confidence_scores_{current_date.strftime('%Y%m%d')}.json"
-    with open(scores_file, 'w') as f:
-        json.dump(all_scores, f, indent=2)
-    
+    dump_json(all_scores, scores_file)
+
     # Featured symbols
     featured_file = OUTPUT_DIR / f"featured_symbols_{current_date.strftime('%Y%m%d')}.json"
-    with open(featured_file, 'w') as f:
-        json.dump(featured_symbols, f, indent=2)
+    dump_json(featured_symbols, featured_file)
     
-    # Summary CSV
+    # Summary CSV (kept for external consumers) plus a columnar Parquet
+    # copy that downstream analysis can read without re-parsing text
     scores_df = pd.DataFrame(all_scores)
     csv_file = OUTPUT_DIR / f"confidence_scores_{current_date.strftime('%Y%m%d')}.csv"
     scores_df.to_csv(csv_file, index=False)
+
+    try:
+        parquet_file = csv_file.with_suffix('.parquet')
+        scores_df.to_parquet(parquet_file, engine='pyarrow', compression='zstd')
+    except ImportError:
+        pass  # pyarrow not installed — CSV remains the only tabular output
     
     print("\n✅ Scoring complete!")
     print(f"\n📊 Summary:")
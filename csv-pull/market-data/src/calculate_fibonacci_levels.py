@@ -6,10 +6,27 @@ Combines price data with astrological timing for market forecasting.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to stdlib json
+    orjson = None
+
+
+def dump_json(obj, path):
+    """Serialize obj to path, preferring orjson's C-level writer."""
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
 # Configuration
 DATA_DIR = Path("~/Dev/Workspaces/Dec-2025/4castr/csv-pull/market-data/data").expanduser()
 ASTRO_DIR = Path("~/Dev/Workspaces/Dec-2025/4castr/csv-pull/market-data/data/astro").expanduser()
@@ -22,6 +39,9 @@ RETRACEMENT_LEVELS = [0.236, 0.382, 0.5, 0.618, 0.786, 1.0, 1.272, 1.618]
 # Fibonacci ratios for fan/speed lines
 FAN_LEVELS = [0.382, 0.5, 0.618]
 
+# Fibonacci time extension ratios for projections
+TIME_RATIOS = np.array([1.0, 1.272, 1.618, 2.618])
+
 # Years to analyze (6 years of historical data for pattern recognition)
 ANALYSIS_YEARS = 6
 
@@ -35,7 +55,11 @@ def load_price_data(category):
         return None
     
     try:
-        df = pd.read_csv(csv_path)
+        try:
+            # pyarrow's multithreaded parser is 2-5x faster when available
+            df = pd.read_csv(csv_path, engine='pyarrow')
+        except (ImportError, ValueError):
+            df = pd.read_csv(csv_path)
         # Standardize column names (preserve original case first)
         
         # Map different column names to standard format
@@ -64,9 +88,11 @@ def load_price_data(category):
             print(f"⚠️  Skipping {category}: missing symbol or price columns")
             return None
         
-        # Parse date column
+        # Parse date column. Normalized to ns: the pyarrow engine can
+        # yield coarser datetime units, which pandas 3 refuses to merge
+        # against ns keys.
         if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'])
+            df['date'] = pd.to_datetime(df['date']).astype('datetime64[ns]')
         else:
             print(f"⚠️  No date column found in {csv_path}")
             return None
@@ -86,107 +112,99 @@ def load_seasonal_anchors():
         return None
     
     df = pd.read_csv(anchors_path)
-    df['date'] = pd.to_datetime(df['date'])
+    # Same ns normalization as load_price_data so merge_asof keys match
+    df['date'] = pd.to_datetime(df['date']).astype('datetime64[ns]')
     return df
 
 
-def get_anchor_price(price_df, anchor_date, anchor_type, symbol):
+def resolve_anchor_prices(symbol_df, recent_anchors):
     """
-    Get the appropriate price for an anchor date.
-    Solstices use HIGH, Equinoxes use LOW.
+    Resolve the appropriate price for every anchor date in one merge.
+    Solstices use HIGH, Equinoxes use LOW; anchors match the nearest
+    price row within ±3 days.
     """
-    # Find the row for this date and symbol
-    date_match = price_df[(price_df['date'] == anchor_date) & (price_df['symbol'] == symbol)]
-    
-    if date_match.empty:
-        # Try nearby dates (±3 days)
-        for offset in [-3, -2, -1, 1, 2, 3]:
-            nearby_date = anchor_date + timedelta(days=offset)
-            date_match = price_df[(price_df['date'] == nearby_date) & (price_df['symbol'] == symbol)]
-            if not date_match.empty:
-                break
-    
-    if date_match.empty:
-        return None
-    
-    row = date_match.iloc[0]
-    
-    # Determine which price to use based on anchor type
-    if anchor_type == 'high':  # Solstices
-        # Try to use 'high' column, fallback to 'price'
-        price = row.get('high', row.get('price', None))
-    else:  # Equinoxes (low)
-        # Try to use 'low' column, fallback to 'price'
-        price = row.get('low', row.get('price', None))
-    
-    return float(price) if price is not None and pd.notna(price) else None
+    anchor_query = recent_anchors[['date', 'type', 'anchor_type', 'sign']].sort_values('date')
 
+    merged = pd.merge_asof(
+        anchor_query,
+        symbol_df.sort_values('date'),
+        on='date',
+        tolerance=pd.Timedelta(days=3),
+        direction='nearest'
+    )
 
-def calculate_fibonacci_retracement(high, low, levels=RETRACEMENT_LEVELS):
-    """Calculate Fibonacci retracement levels between high and low."""
-    diff = high - low
-    
-    retracements = {}
-    for level in levels:
-        if level <= 1.0:
-            # Standard retracements (below 100%)
-            retracements[f'{level:.3f}'] = low + (diff * level)
-        else:
-            # Extensions (above 100%)
-            retracements[f'{level:.3f}'] = high + (diff * (level - 1))
-    
-    return retracements
+    # Determine which price to use based on anchor type, falling back to
+    # 'price' where the high/low columns are absent or empty
+    price = merged['price']
+    high = merged['high'].fillna(price) if 'high' in merged.columns else price
+    low = merged['low'].fillna(price) if 'low' in merged.columns else price
+
+    merged['anchor_price'] = np.where(merged['anchor_type'] == 'high', high, low)
 
+    # Drop anchors with no price row within tolerance
+    return merged.dropna(subset=['anchor_price'])
 
-def calculate_fibonacci_fan(start_price, end_price, start_date, end_date, levels=FAN_LEVELS):
+
+def calculate_fibonacci_retracement(highs, lows, levels=RETRACEMENT_LEVELS):
     """
-    Calculate Fibonacci fan (speed resistance) lines.
-    These are trend lines drawn at Fibonacci angles.
+    Calculate Fibonacci retracement levels for every high/low pair at once.
+    Returns an (n_pairs, n_levels) matrix.
     """
-    time_diff = (end_date - start_date).days
-    price_diff = end_price - start_price
-    
-    fan_lines = {}
-    for level in levels:
-        # Calculate the slope for this Fibonacci level
-        slope = (price_diff * level) / time_diff
-        fan_lines[f'{level:.3f}'] = {
-            'slope': slope,
-            'start_price': start_price,
-            'start_date': start_date.strftime('%Y-%m-%d'),
-            'level': level
-        }
-    
-    return fan_lines
+    highs = np.asarray(highs, dtype=np.float64)[:, None]
+    lows = np.asarray(lows, dtype=np.float64)[:, None]
+    level_arr = np.asarray(levels, dtype=np.float64)
+    diff = highs - lows
+
+    # Standard retracements below 100%, extensions above
+    return np.where(
+        level_arr <= 1.0,
+        lows + diff * level_arr,
+        highs + diff * (level_arr - 1)
+    )
 
 
-def calculate_time_projections(start_date, end_date, target_levels):
+def calculate_fibonacci_fan(start_prices, end_prices, time_spans, levels=FAN_LEVELS):
+    """
+    Calculate Fibonacci fan (speed resistance) slopes for every anchor pair.
+    These are trend lines drawn at Fibonacci angles; returns an
+    (n_pairs, n_levels) matrix of slopes.
+    """
+    price_diffs = (
+        np.asarray(end_prices, dtype=np.float64) -
+        np.asarray(start_prices, dtype=np.float64)
+    )
+    level_arr = np.asarray(levels, dtype=np.float64)
+
+    return (price_diffs[:, None] * level_arr) / np.asarray(time_spans, dtype=np.float64)[:, None]
+
+
+def calculate_time_projections(end_date, time_span, target_levels):
     """
     Project when price might reach certain levels based on time.
-    Uses Fibonacci time ratios.
+    Uses Fibonacci time ratios; the date arithmetic for every ratio runs
+    as one datetime64 vector op instead of per-ratio timedelta math.
     """
-    time_span = (end_date - start_date).days
-    
-    projections = {}
-    for level_name, level_price in target_levels.items():
-        # Project dates using Fibonacci time extensions
-        for time_ratio in [1.0, 1.272, 1.618, 2.618]:
-            projected_days = int(time_span * time_ratio)
-            projected_date = end_date + timedelta(days=projected_days)
-            
-            if projected_date > datetime.now():
-                projections[f'{level_name}_t{time_ratio}'] = {
-                    'target_price': level_price,
-                    'target_date': projected_date.strftime('%Y-%m-%d'),
-                    'time_ratio': time_ratio,
-                    'days_from_anchor': projected_days
-                }
-    
-    return projections
+    projected_days = (time_span * TIME_RATIOS).astype(np.int64)
+    projected_dates = np.datetime64(end_date, 'D') + projected_days.astype('timedelta64[D]')
+    future_mask = projected_dates > np.datetime64(datetime.now(), 'D')
+    date_strings = np.datetime_as_string(projected_dates, unit='D')
+
+    # Only future dates are kept; the dates are shared across levels
+    return {
+        f'{level_name}_t{time_ratio}': {
+            'target_price': level_price,
+            'target_date': date_strings[j],
+            'time_ratio': float(time_ratio),
+            'days_from_anchor': int(projected_days[j])
+        }
+        for level_name, level_price in target_levels.items()
+        for j, time_ratio in enumerate(TIME_RATIOS)
+        if future_mask[j]
+    }
 
 
-def process_symbol(symbol, price_df, anchors_df, category):
-    """Process a single symbol and calculate all Fibonacci levels."""
+def process_symbol(symbol, symbol_df, anchors_df, category):
+    """Process a single symbol's price rows and calculate all Fibonacci levels."""
     result = {
         'symbol': symbol,
         'category': category,
@@ -202,35 +220,22 @@ def process_symbol(symbol, price_df, anchors_df, category):
     if recent_anchors.empty:
         return None
     
-    # Filter price data for this symbol
-    symbol_df = price_df[price_df['symbol'] == symbol].copy()
-    
     if symbol_df.empty:
         return None
-    
-    # Process each anchor
-    for idx, anchor in recent_anchors.iterrows():
-        anchor_date = anchor['date']
-        anchor_type = anchor['anchor_type']
-        seasonal_type = anchor['type']
-        
-        # Get the appropriate price for this anchor
-        anchor_price = get_anchor_price(
-            symbol_df, 
-            anchor_date, 
-            anchor_type, 
-            symbol
-        )
-        
-        if anchor_price is None:
-            continue
-        
+
+    # Resolve every anchor's price with a single tolerance merge, keeping
+    # the raw dates alongside the formatted strings so the pair math never
+    # re-parses what it just serialized
+    resolved = resolve_anchor_prices(symbol_df, recent_anchors)
+    anchor_dates = resolved['date'].values.astype('datetime64[D]')
+
+    for anchor in resolved.itertuples(index=False):
         result['anchors'].append({
-            'date': anchor_date.strftime('%Y-%m-%d'),
-            'type': seasonal_type,
-            'anchor_type': anchor_type,
-            'price': anchor_price,
-            'sign': anchor['sign']
+            'date': anchor.date.strftime('%Y-%m-%d'),
+            'type': anchor.type,
+            'anchor_type': anchor.anchor_type,
+            'price': float(anchor.anchor_price),
+            'sign': anchor.sign
         })
     
     # Skip if we don't have enough anchors
@@ -239,39 +244,55 @@ def process_symbol(symbol, price_df, anchors_df, category):
     
     # Calculate Fibonacci levels between consecutive anchors
     anchors_list = result['anchors']
-    
+
+    prices = np.array([a['price'] for a in anchors_list], dtype=np.float64)
+
+    price1 = prices[:-1]
+    price2 = prices[1:]
+
+    # Determine high and low per pair in one vectorized pass
+    highs = np.maximum(price1, price2)
+    lows = np.minimum(price1, price2)
+    time_spans = (anchor_dates[1:] - anchor_dates[:-1]).astype(np.int64)
+
+    # Calculate all pair retracements and fan slopes in two broadcasts
+    retracement_matrix = calculate_fibonacci_retracement(highs, lows)
+    fan_slopes = calculate_fibonacci_fan(price1, price2, time_spans)
+
     for i in range(len(anchors_list) - 1):
         anchor1 = anchors_list[i]
         anchor2 = anchors_list[i + 1]
-        
-        price1 = anchor1['price']
-        price2 = anchor2['price']
-        date1 = pd.to_datetime(anchor1['date'])
-        date2 = pd.to_datetime(anchor2['date'])
-        
-        # Determine high and low
-        high = max(price1, price2)
-        low = min(price1, price2)
-        
-        # Calculate retracements
-        retracements = calculate_fibonacci_retracement(high, low)
-        
-        # Calculate fan lines
-        fan_lines = calculate_fibonacci_fan(price1, price2, date1, date2)
-        
+
+        retracements = {
+            f'{level:.3f}': float(retracement_matrix[i, j])
+            for j, level in enumerate(RETRACEMENT_LEVELS)
+        }
+
+        fan_lines = {
+            f'{level:.3f}': {
+                'slope': float(fan_slopes[i, j]),
+                'start_price': anchor1['price'],
+                'start_date': anchor1['date'],
+                'level': level
+            }
+            for j, level in enumerate(FAN_LEVELS)
+        }
+
         # Calculate time projections
-        projections = calculate_time_projections(date1, date2, retracements)
-        
+        projections = calculate_time_projections(
+            anchor_dates[i + 1], int(time_spans[i]), retracements
+        )
+
         level_key = f"{anchor1['date']}_to_{anchor2['date']}"
         result['fibonacci_levels'][level_key] = {
             'from_anchor': anchor1,
             'to_anchor': anchor2,
-            'high': high,
-            'low': low,
+            'high': float(highs[i]),
+            'low': float(lows[i]),
             'retracements': retracements,
             'fan_lines': fan_lines,
-            'current_range': high - low,
-            'time_span_days': (date2 - date1).days
+            'current_range': float(highs[i] - lows[i]),
+            'time_span_days': int(time_spans[i])
         }
         
         # Add projections for future dates
@@ -284,6 +305,11 @@ def process_symbol(symbol, price_df, anchors_df, category):
     return result
 
 
+def _process_symbol_task(args):
+    """Unpack a (symbol, symbol_df, anchors_df, category) task for the pool."""
+    return process_symbol(*args)
+
+
 def main():
     print("🎯 Starting Fibonacci level calculations...")
     print(f"📊 Analyzing {ANALYSIS_YEARS} years of historical anchor data")
@@ -315,21 +341,22 @@ def main():
             print(f"⚠️  No symbol column found in {category}")
             continue
         
-        symbols = price_df['symbol'].unique()
-        print(f"   Found {len(symbols)} symbols")
-        
+        # Partition the category frame once instead of filtering per symbol
+        symbol_groups = price_df.groupby('symbol', sort=False)
+        print(f"   Found {symbol_groups.ngroups} symbols")
+
+        # Symbols are independent — fan the per-symbol work across cores
+        tasks = [
+            (symbol, symbol_df, anchors_df, category)
+            for symbol, symbol_df in symbol_groups
+        ]
+
         processed_count = 0
-        for symbol in symbols:
-            result = process_symbol(
-                symbol, 
-                price_df, 
-                anchors_df, 
-                category
-            )
-            
-            if result and result['anchors']:
-                all_results.append(result)
-                processed_count += 1
+        with ProcessPoolExecutor() as executor:
+            for result in executor.map(_process_symbol_task, tasks, chunksize=8):
+                if result and result['anchors']:
+                    all_results.append(result)
+                    processed_count += 1
         
         print(f"   ✅ Processed {processed_count} symbols")
     
@@ -338,27 +365,42 @@ def main():
     
     # Save as JSON for easy API consumption
     output_file = OUTPUT_DIR / 'fibonacci_levels.json'
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    dump_json(all_results, output_file)
     
-    # Also save as CSV for analysis
-    flat_results = []
+    # Also save as CSV/Parquet for analysis — assembled column-wise so there
+    # is no per-row dict creation and no dtype inference over rows
+    columns = {
+        'symbol': [], 'category': [], 'anchor_pair': [],
+        'high': [], 'low': [], 'range': [], 'time_span_days': []
+    }
+    fib_columns = {f'fib_{level:.3f}': [] for level in RETRACEMENT_LEVELS}
+
     for result in all_results:
         for level_key, level_data in result['fibonacci_levels'].items():
-            flat_results.append({
-                'symbol': result['symbol'],
-                'category': result['category'],
-                'anchor_pair': level_key,
-                'high': level_data['high'],
-                'low': level_data['low'],
-                'range': level_data['current_range'],
-                'time_span_days': level_data['time_span_days'],
-                **{f'fib_{k}': v for k, v in level_data['retracements'].items()}
-            })
-    
-    if flat_results:
+            columns['symbol'].append(result['symbol'])
+            columns['category'].append(result['category'])
+            columns['anchor_pair'].append(level_key)
+            columns['high'].append(level_data['high'])
+            columns['low'].append(level_data['low'])
+            columns['range'].append(level_data['current_range'])
+            columns['time_span_days'].append(level_data['time_span_days'])
+            for name, value in level_data['retracements'].items():
+                fib_columns[f'fib_{name}'].append(value)
+
+    if columns['symbol']:
         csv_output = OUTPUT_DIR / 'fibonacci_levels.csv'
-        pd.DataFrame(flat_results).to_csv(csv_output, index=False)
+        parquet_output = OUTPUT_DIR / 'fibonacci_levels.parquet'
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            import pyarrow.parquet as pa_parquet
+
+            table = pa.table({**columns, **fib_columns})
+            pa_csv.write_csv(table, csv_output)
+            pa_parquet.write_table(table, parquet_output, compression='zstd')
+        except ImportError:
+            # pyarrow not installed — pandas still consumes the same columns
+            pd.DataFrame({**columns, **fib_columns}).to_csv(csv_output, index=False)
     
     print(f"\n✅ Calculation complete!")
     print(f"📊 Processed {len(all_results)} symbols")
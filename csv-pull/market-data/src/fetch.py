@@ -5,9 +5,49 @@ Install: pip install yfinance pandas
 """
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import logging
 import os
+import sys
+import time
+
+# Optional: pyarrow's CSV writer formats columns in parallel C++ and is
+# several times faster than DataFrame.to_csv
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pa_parquet
+except ImportError:
+    pa = None
+
+# Logging instead of print: handler locking keeps interleaved progress
+# lines intact once chunks download on the thread pool
+log = logging.getLogger(__name__)
+
+# Optional: transparent HTTP caching so repeated runs (and retries within
+# a run) don't re-hit identical Yahoo URLs
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# One shared session so the cookie/crumb handshake is paid once per run
+# instead of once per Ticker
+if requests_cache is not None:
+    _SESSION = requests_cache.CachedSession(
+        os.path.join(os.path.dirname(__file__), '.yf_cache'),
+        expire_after=3600)
+else:
+    _SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                   'AppleWebKit/537.36 (KHTML, like Gecko) '
+                   'Chrome/120.0.0.0 Safari/537.36')
+})
 
 # Target dates
 DATES = [
@@ -18,6 +58,21 @@ DATES = [
     '2025-03-20', '2025-06-20', '2025-09-22', '2025-12-21'
 ]
 
+# Parsed once at import; date filters compare datetime64 values directly
+# instead of building a string per row on every symbol.
+DATES_DT = pd.to_datetime(DATES).values.astype('datetime64[D]')
+
+
+def _filter_target_dates(df):
+    """Keep only rows whose (tz-naive) date is one of the target dates."""
+    idx = pd.to_datetime(df.index)
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    days = idx.normalize().values.astype('datetime64[D]')
+    df = df[np.isin(days, DATES_DT)].copy()
+    df.index = pd.to_datetime(df.index).strftime('%Y-%m-%d')
+    return df
+
 # Symbols from your config
 EQUITIES = [
     "SPY", "QQQ", "XLY", "AAL", "AIG", "AMZN", "AXP", "BA", "BABA", "BAC",
@@ -81,210 +136,391 @@ RATES_MACRO = {
     'TLT': 'TLT'  # 20+ Year Treasury Bond ETF
 }
 
+# Fixed output schema for the OHLCV categories (equities, rates/macro)
+OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Fetch window, resolved once at import so every category sees the same
+# dates even when a run crosses midnight
+START_DATE = '2005-01-01'
+END_DATE = '2025-12-31'
+TODAY = datetime.now().strftime('%Y-%m-%d')
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+CACHE_DIR = os.path.join(DATA_DIR, 'cache')
+
+
+def _cache_path(symbol):
+    return os.path.join(CACHE_DIR, f"{symbol.replace('/', '_')}.parquet")
 
-def fetch_data(symbol, start='2005-01-01', end='2025-12-31'):
-    """Fetch data for a symbol"""
+
+def _load_cached(symbol):
+    """Read a symbol's cached frame; None if absent or unreadable."""
+    path = _cache_path(symbol)
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path, engine='pyarrow')
+    except Exception:
+        return None
+
+
+def _store_cached(symbol, df):
+    """Best-effort cache write; the run already holds the frame in memory."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(_cache_path(symbol), engine='pyarrow')
+    except Exception:
+        pass
+
+def fetch_data(symbol, start=START_DATE, end=END_DATE):
+    """Fetch data for a single symbol (fallback path)"""
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = yf.Ticker(symbol, session=_SESSION)
         df = ticker.history(start=start, end=end, interval='1d')
-        
+
         if df.empty:
             return None
-        
-        # Filter to target dates
-        df.index = pd.to_datetime(df.index).strftime('%Y-%m-%d')
-        df = df[df.index.isin(DATES)]
-        
-        return df
+
+        return _filter_target_dates(df)
     except Exception as e:
-        print(f"  ✗ {symbol}: {str(e)[:50]}")
+        log.warning(f"  ✗ {symbol}: {str(e)[:50]}")
         return None
 
+# Yahoo truncates very long multi-symbol URLs, so batches are capped
+# at 20 symbols per request
+BATCH_SIZE = 20
+
+# Concurrent chunk downloads; kept modest to stay under Yahoo's rate limit
+MAX_WORKERS = 8
+
+
+def _is_adjustable(symbol):
+    """Whether a symbol can carry split/dividend adjustments.
+
+    Indices, futures, FX pairs and crypto never do, so the adjustment
+    pass is wasted work for them.
+    """
+    return not (symbol.startswith('^') or symbol.endswith(('=F', '=X'))
+                or '-USD' in symbol or symbol == 'DX-Y.NYB')
+
+
+def _chunked_by_adjustment(yahoo_symbols):
+    """Split symbols into (chunk, auto_adjust) groups of BATCH_SIZE."""
+    groups = []
+    for adjust in (True, False):
+        subset = [s for s in yahoo_symbols if _is_adjustable(s) == adjust]
+        for i in range(0, len(subset), BATCH_SIZE):
+            groups.append((subset[i:i + BATCH_SIZE], adjust))
+    return groups
+
+
+def _download_chunk(yahoo_symbols, start, end, auto_adjust=True):
+    """Download one group of symbols with a single yf.download call."""
+    try:
+        data = yf.download(
+            tickers=' '.join(yahoo_symbols),
+            start=start, end=end, interval='1d',
+            group_by='ticker', threads=False,
+            auto_adjust=auto_adjust, progress=False,
+            multi_level_index=len(yahoo_symbols) > 1,
+            timeout=10, session=_SESSION
+        )
+    except Exception as e:
+        log.warning(f"  ✗ batch download failed: {str(e)[:50]}")
+        return {}
+
+    if data is None or data.empty:
+        return {}
+
+    frames = {}
+    for symbol in yahoo_symbols:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            df = data[symbol].dropna(how='all')
+        else:
+            # Single symbol requested - flat columns
+            df = data.dropna(how='all')
+
+        if df.empty:
+            continue
+
+        df = _filter_target_dates(df)
+
+        if not df.empty:
+            frames[symbol] = df
+
+    return frames
+
+
+def fetch_batch(yahoo_symbols, start=START_DATE, end=END_DATE):
+    """Fetch history for many symbols in batched yf.download calls.
+
+    Symbols are split into groups of BATCH_SIZE so each request stays
+    under Yahoo's URL limit, and the groups download concurrently since
+    the work is network-latency-bound. Symbols already covered by the
+    on-disk parquet cache are served from it and only the missing date
+    range is downloaded. Returns a dict of yahoo symbol -> DataFrame
+    filtered to the target dates.
+    """
+    horizon = min(end, TODAY)
+
+    frames = {}
+    stale = []
+    download_start = None
+    for symbol in yahoo_symbols:
+        cached = _load_cached(symbol)
+        if cached is None or cached.empty:
+            stale.append(symbol)
+            download_start = start
+            continue
+        frames[symbol] = cached
+        # ISO date strings compare chronologically
+        next_day = (pd.Timestamp(cached.index.max()) + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+        if next_day <= horizon:
+            stale.append(symbol)
+            if download_start is None or next_day < download_start:
+                download_start = next_day
+
+    if not stale:
+        return frames
+
+    chunks = _chunked_by_adjustment(stale)
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for chunk_frames in executor.map(
+                lambda c: _download_chunk(c[0], download_start, end, c[1]),
+                chunks):
+            fetched.update(chunk_frames)
+
+    # Many Yahoo failures (rate limits, intermittent 404s) are transient
+    # and succeed on a second pass; retry just the missing symbols with
+    # exponential backoff instead of abandoning them.
+    # Cached symbols are excluded: an empty delta there just means no
+    # new target dates, not a failed request.
+    missing = [s for s in stale if s not in fetched and s not in frames]
+    for attempt in range(3):
+        if not missing:
+            break
+        time.sleep(2 ** attempt)
+        for chunk, adjust in _chunked_by_adjustment(missing):
+            fetched.update(_download_chunk(chunk, download_start, end, adjust))
+        missing = [s for s in missing if s not in fetched]
+
+    for symbol, new in fetched.items():
+        cached = frames.get(symbol)
+        if cached is not None:
+            combined = pd.concat([cached, new])
+            combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+            frames[symbol] = combined
+        else:
+            frames[symbol] = new
+        _store_cached(symbol, frames[symbol])
+
+    return frames
+
+class _CategoryWriter:
+    """Stream per-symbol frames straight into a category CSV.
+
+    Each symbol's rows hit disk as soon as they are built, so peak
+    memory stays at one symbol's frame instead of the whole category.
+    The header goes out with the first part only. When pyarrow is
+    available a zstd-compressed parquet copy is streamed next to the
+    CSV so downstream Python consumers can skip CSV parsing; the CSV
+    itself stays primary because csvAdapter.js reads it.
+    """
+
+    def __init__(self, subdir, filename):
+        self.path = os.path.join(DATA_DIR, subdir, filename)
+        self.parquet_path = os.path.splitext(self.path)[0] + '.parquet'
+        self.rows = 0
+        self._pa_writer = None
+        self._pq_writer = None
+        self._schema = None
+
+    def write(self, part):
+        # Halve the bytes the serializer has to scan: float32 carries
+        # Yahoo's 2-decimal quotes exactly enough. The rule is fixed per
+        # column, never per part's values, so every part matches the
+        # schema frozen from the first one. Volume stays wide: crypto
+        # dollar volumes overflow int32 and lose precision in float32.
+        for col in part.columns:
+            if col != 'Volume' and part[col].dtype == np.float64:
+                part[col] = part[col].astype(np.float32)
+        if pa is not None:
+            table = pa.Table.from_pandas(part, preserve_index=False)
+            if self._pa_writer is None:
+                self._schema = table.schema
+                self._pa_writer = pa_csv.CSVWriter(self.path, self._schema)
+                self._pq_writer = pa_parquet.ParquetWriter(
+                    self.parquet_path, self._schema, compression='zstd')
+            elif table.schema != self._schema:
+                table = table.cast(self._schema)
+            self._pa_writer.write_table(table)
+            self._pq_writer.write_table(table)
+        else:
+            first = self.rows == 0
+            part.to_csv(self.path, index=False, mode='w' if first else 'a',
+                        header=first, lineterminator='\n')
+        self.rows += len(part)
+
+    def finish(self, success, total, unit, category):
+        if self._pa_writer is not None:
+            self._pa_writer.close()
+            self._pq_writer.close()
+        if self.rows:
+            log.info(f"✓ Saved: {self.rows} rows ({success}/{total} {unit})")
+        else:
+            log.warning(f"⚠️  No {category} data collected")
+
 def save_equities():
     """Fetch and save equity data"""
-    print("\n📈 Fetching Equities...")
-    all_data = []
+    log.info("\n📈 Fetching Equities...")
+    writer = _CategoryWriter('equities', 'equities_solstice_equinox.csv')
     success = 0
-    
+
+    frames = fetch_batch(EQUITIES)
     for symbol in EQUITIES:
-        df = fetch_data(symbol)
+        df = frames.get(symbol)
         if df is not None and not df.empty:
-            for date, row in df.iterrows():
-                all_data.append({
-                    'Symbol': symbol,
-                    'Date': date,
-                    'Open': row['Open'],
-                    'High': row['High'],
-                    'Low': row['Low'],
-                    'Close': row['Close'],
-                    'Volume': row['Volume']
-                })
+            part = pd.DataFrame({
+                'Symbol': symbol,
+                'Date': df.index,
+                **{col: df[col].values for col in OHLCV_COLUMNS}
+            })
+            writer.write(part)
             success += 1
-            print(f"  ✓ {symbol}")
+            log.info(f"  ✓ {symbol}")
         else:
-            print(f"  ✗ {symbol}")
-    
-    if all_data:
-        df_out = pd.DataFrame(all_data)
-        output_path = os.path.join(DATA_DIR, 'equities', 'equities_solstice_equinox.csv')
-        df_out.to_csv(output_path, index=False)
-        print(f"✓ Saved: {len(all_data)} rows ({success}/{len(EQUITIES)} symbols)")
-    else:
-        print("⚠️  No equity data collected")
+            log.warning(f"  ✗ {symbol}")
+
+    writer.finish(success, len(EQUITIES), 'symbols', 'equity')
 
 def save_crypto():
     """Fetch and save crypto data"""
-    print("\n📊 Fetching Crypto...")
-    all_data = []
+    log.info("\n📊 Fetching Crypto...")
+    writer = _CategoryWriter('crypto', 'crypto_solstice_equinox.csv')
     success = 0
-    
+
+    frames = fetch_batch(list(CRYPTO.values()))
     for ticker, yahoo_symbol in CRYPTO.items():
-        df = fetch_data(yahoo_symbol)
+        df = frames.get(yahoo_symbol)
         if df is not None and not df.empty:
-            for date, row in df.iterrows():
-                all_data.append({
-                    'Symbol': ticker,
-                    'Date': date,
-                    'Price': row['Close'],
-                    'Volume': row['Volume'],
-                    'Market Cap': None
-                })
+            part = pd.DataFrame({
+                'Symbol': ticker,
+                'Date': df.index,
+                'Price': df['Close'].values,
+                'Volume': df['Volume'].values,
+                'Market Cap': None
+            })
+            writer.write(part)
             success += 1
-            print(f"  ✓ {ticker}")
+            log.info(f"  ✓ {ticker}")
         else:
-            print(f"  ✗ {ticker}")
-    
-    if all_data:
-        df_out = pd.DataFrame(all_data)
-        output_path = os.path.join(DATA_DIR, 'crypto', 'crypto_solstice_equinox.csv')
-        df_out.to_csv(output_path, index=False)
-        print(f"✓ Saved: {len(all_data)} rows ({success}/{len(CRYPTO)} coins)")
-    else:
-        print("⚠️  No crypto data collected")
+            log.warning(f"  ✗ {ticker}")
+
+    writer.finish(success, len(CRYPTO), 'coins', 'crypto')
 
 def save_forex():
     """Fetch and save forex data"""
-    print("\n💱 Fetching Forex...")
-    all_data = []
+    log.info("\n💱 Fetching Forex...")
+    writer = _CategoryWriter('forex', 'forex_solstice_equinox.csv')
     success = 0
-    
+
+    frames = fetch_batch([yahoo_symbol for _, _, yahoo_symbol in FOREX])
     for base, quote, yahoo_symbol in FOREX:
-        df = fetch_data(yahoo_symbol)
+        df = frames.get(yahoo_symbol)
         if df is not None and not df.empty:
-            for date, row in df.iterrows():
-                all_data.append({
-                    'Pair': f"{base}{quote}",
-                    'Date': date,
-                    'Rate': row['Close'],
-                    'Change %': 0
-                })
+            part = pd.DataFrame({
+                'Pair': f"{base}{quote}",
+                'Date': df.index,
+                'Rate': df['Close'].values,
+                'Change %': 0
+            })
+            writer.write(part)
             success += 1
-            print(f"  ✓ {base}{quote}")
+            log.info(f"  ✓ {base}{quote}")
         else:
-            print(f"  ✗ {base}{quote}")
-    
-    if all_data:
-        df_out = pd.DataFrame(all_data)
-        output_path = os.path.join(DATA_DIR, 'forex', 'forex_solstice_equinox.csv')
-        df_out.to_csv(output_path, index=False)
-        print(f"✓ Saved: {len(all_data)} rows ({success}/{len(FOREX)} pairs)")
-    else:
-        print("⚠️  No forex data collected")
+            log.warning(f"  ✗ {base}{quote}")
+
+    writer.finish(success, len(FOREX), 'pairs', 'forex')
 
 def save_commodities():
     """Fetch and save commodity data"""
-    print("\n🌾 Fetching Commodities...")
-    all_data = []
+    log.info("\n🌾 Fetching Commodities...")
+    writer = _CategoryWriter('commodities', 'commodities_solstice_equinox.csv')
     success = 0
-    
+
+    frames = fetch_batch(list(COMMODITIES.values()))
     for name, yahoo_symbol in COMMODITIES.items():
-        df = fetch_data(yahoo_symbol)
+        df = frames.get(yahoo_symbol)
         if df is not None and not df.empty:
-            for date, row in df.iterrows():
-                all_data.append({
-                    'Commodity': name,
-                    'Date': date,
-                    'Price': row['Close'],
-                    'Unit': 'USD'
-                })
+            part = pd.DataFrame({
+                'Commodity': name,
+                'Date': df.index,
+                'Price': df['Close'].values,
+                'Unit': 'USD'
+            })
+            writer.write(part)
             success += 1
-            print(f"  ✓ {name}")
+            log.info(f"  ✓ {name}")
         else:
-            print(f"  ✗ {name}")
-    
-    if all_data:
-        df_out = pd.DataFrame(all_data)
-        output_path = os.path.join(DATA_DIR, 'commodities', 'commodities_solstice_equinox.csv')
-        df_out.to_csv(output_path, index=False)
-        print(f"✓ Saved: {len(all_data)} rows ({success}/{len(COMMODITIES)} commodities)")
-    else:
-        print("⚠️  No commodity data collected")
+            log.warning(f"  ✗ {name}")
+
+    writer.finish(success, len(COMMODITIES), 'commodities', 'commodity')
 
 def save_stress():
     """Fetch and save stress indicators"""
-    print("\n⚡ Fetching Stress Indicators...")
-    all_data = []
+    log.info("\n⚡ Fetching Stress Indicators...")
+    writer = _CategoryWriter('stress', 'stress_solstice_equinox.csv')
     success = 0
-    
+
+    frames = fetch_batch(list(STRESS.values()))
     for name, yahoo_symbol in STRESS.items():
-        df = fetch_data(yahoo_symbol)
+        df = frames.get(yahoo_symbol)
         if df is not None and not df.empty:
-            for date, row in df.iterrows():
-                all_data.append({
-                    'Indicator': name,
-                    'Date': date,
-                    'Value': row['Close'],
-                    'Unit': 'index'
-                })
+            part = pd.DataFrame({
+                'Indicator': name,
+                'Date': df.index,
+                'Value': df['Close'].values,
+                'Unit': 'index'
+            })
+            writer.write(part)
             success += 1
-            print(f"  ✓ {name}")
+            log.info(f"  ✓ {name}")
         else:
-            print(f"  ✗ {name}")
-    
-    if all_data:
-        df_out = pd.DataFrame(all_data)
-        output_path = os.path.join(DATA_DIR, 'stress', 'stress_solstice_equinox.csv')
-        df_out.to_csv(output_path, index=False)
-        print(f"✓ Saved: {len(all_data)} rows ({success}/{len(STRESS)} indicators)")
-    else:
-        print("⚠️  No stress data collected")
+            log.warning(f"  ✗ {name}")
+
+    writer.finish(success, len(STRESS), 'indicators', 'stress')
 
 def save_rates_macro():
     """Fetch and save rates/macro data"""
-    print("\n📉 Fetching Rates/Macro...")
-    all_data = []
+    log.info("\n📉 Fetching Rates/Macro...")
+    writer = _CategoryWriter('rates-macro', 'rates_macro_solstice_equinox.csv')
     success = 0
-    
+
+    frames = fetch_batch(list(RATES_MACRO.values()))
     for name, yahoo_symbol in RATES_MACRO.items():
-        df = fetch_data(yahoo_symbol)
+        df = frames.get(yahoo_symbol)
         if df is not None and not df.empty:
-            for date, row in df.iterrows():
-                all_data.append({
-                    'Symbol': name,
-                    'Date': date,
-                    'Open': row['Open'],
-                    'High': row['High'],
-                    'Low': row['Low'],
-                    'Close': row['Close'],
-                    'Volume': row['Volume']
-                })
+            part = pd.DataFrame({
+                'Symbol': name,
+                'Date': df.index,
+                **{col: df[col].values for col in OHLCV_COLUMNS}
+            })
+            writer.write(part)
             success += 1
-            print(f"  ✓ {name}")
+            log.info(f"  ✓ {name}")
         else:
-            print(f"  ✗ {name}")
-    
-    if all_data:
-        df_out = pd.DataFrame(all_data)
-        output_path = os.path.join(DATA_DIR, 'rates-macro', 'rates_macro_solstice_equinox.csv')
-        df_out.to_csv(output_path, index=False)
-        print(f"✓ Saved: {len(all_data)} rows ({success}/{len(RATES_MACRO)} symbols)")
-    else:
-        print("⚠️  No rates/macro data collected")
+            log.warning(f"  ✗ {name}")
+
+    writer.finish(success, len(RATES_MACRO), 'symbols', 'rates/macro')
 
 def main():
-    print("🚀 Python yfinance Fetcher")
-    print("📅 Years: 2005, 2015, 2018, 2022, 2025\n")
+    logging.basicConfig(level=logging.INFO, format='%(message)s',
+                        stream=sys.stderr)
+    log.info("🚀 Python yfinance Fetcher")
+    log.info("📅 Years: 2005, 2015, 2018, 2022, 2025\n")
     
     # Ensure directories exist
     for subdir in ['equities', 'crypto', 'forex', 'commodities', 'stress', 'rates-macro']:
@@ -297,7 +533,7 @@ def main():
     save_stress()
     save_rates_macro()
     
-    print("\n✅ Complete!\n")
+    log.info("\n✅ Complete!\n")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -8,12 +8,19 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
+import itertools
 import json
+import os
 from skyfield.api import load, Topos
 from skyfield import almanac
 from skyfield.framelib import ecliptic_frame
 import swisseph as swe
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional — fall back to plain NumPy
+    njit = None
+
 # Configuration
 START_DATE = datetime(2004, 12, 21)
 END_DATE = datetime.now()
@@ -30,20 +37,29 @@ EPHE_PATH = Path.home() / '.swisseph'
 EPHE_PATH.mkdir(exist_ok=True)
 swe.set_ephe_path(str(EPHE_PATH))
 
-# Download ephemeris files if needed
+# Download ephemeris files if needed (in parallel — the fetches are
+# independent, so first-run bootstrap pays one network round-trip, not three)
 import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 EPHE_FILES = ['seas_18.se1', 'semo_18.se1', 'sepl_18.se1']
-for filename in EPHE_FILES:
-    filepath = EPHE_PATH / filename
-    if not filepath.exists():
-        print(f'📥 Downloading ephemeris file: {filename}...')
-        url = f'https://github.com/astrorigin/pyswisseph/raw/master/swisseph/{filename}'
-        try:
-            urllib.request.urlretrieve(url, filepath)
-            print(f'✅ Downloaded {filename}')
-        except Exception as e:
-            print(f'⚠️  Could not download {filename}: {e}')
-            print(f'   You may need to manually download from: https://www.astro.com/ftp/swisseph/ephe/')
+
+
+def _download_ephe_file(filename):
+    print(f'📥 Downloading ephemeris file: {filename}...')
+    url = f'https://github.com/astrorigin/pyswisseph/raw/master/swisseph/{filename}'
+    try:
+        urllib.request.urlretrieve(url, EPHE_PATH / filename)
+        print(f'✅ Downloaded {filename}')
+    except Exception as e:
+        print(f'⚠️  Could not download {filename}: {e}')
+        print(f'   You may need to manually download from: https://www.astro.com/ftp/swisseph/ephe/')
+
+
+_missing_files = [f for f in EPHE_FILES if not (EPHE_PATH / f).exists()]
+if _missing_files:
+    with ThreadPoolExecutor(max_workers=len(_missing_files)) as _ex:
+        list(_ex.map(_download_ephe_file, _missing_files))
 
 # Planet definitions
 PRIMARY_PLANETS = {
@@ -69,6 +85,18 @@ CHART_POINTS = {
     'Lilith': {'code': 12, 'influence': 30, 'orb_strict': 1.0}
 }
 
+# Struct-of-arrays body layout: every per-(day, body) quantity below is a
+# 2D array indexed by (day, BODY_IDX[name])
+BODY_NAMES = list(PRIMARY_PLANETS) + list(OUTER_PLANETS) + list(CHART_POINTS)
+BODY_CODES = (list(PRIMARY_PLANETS.values())
+              + [v['code'] for v in OUTER_PLANETS.values()]
+              + [v['code'] for v in CHART_POINTS.values()])
+BODY_IDX = {name: i for i, name in enumerate(BODY_NAMES)}
+# Influence weights aligned with BODY_NAMES (primaries carry none)
+BODY_INFLUENCE = np.array([0] * len(PRIMARY_PLANETS)
+                          + [v['influence'] for v in OUTER_PLANETS.values()]
+                          + [v['influence'] for v in CHART_POINTS.values()])
+
 ANGLES = {
     'MC': {'influence': 65, 'orb_strict': 1.0},
     'IC': {'influence': 60, 'orb_strict': 1.0},
@@ -85,6 +113,13 @@ ASPECTS = [
     {'name': 'opposition', 'degrees': 180, 'orb': 6, 'nature': 'harsh'}
 ]
 
+# Aspect table as parallel arrays so hot paths index by integer instead
+# of looking up dict keys per comparison
+ASPECT_DEG = np.array([a['degrees'] for a in ASPECTS], dtype=np.float64)
+ASPECT_ORB = np.array([a['orb'] for a in ASPECTS], dtype=np.float64)
+ASPECT_NAME = np.array([a['name'] for a in ASPECTS])
+ASPECT_NATURE = np.array([a['nature'] for a in ASPECTS])
+
 # Zodiac signs with rulerships
 ZODIAC_SIGNS = [
     {'name': 'Aries', 'ruler': 'Mars', 'element': 'fire', 'modality': 'cardinal'},
@@ -101,9 +136,21 @@ ZODIAC_SIGNS = [
     {'name': 'Pisces', 'ruler': 'Jupiter', 'element': 'water', 'modality': 'mutable'}
 ]
 
+# Sign metadata as parallel arrays so whole longitude arrays can be
+# mapped to signs with one fancy-index instead of a dict lookup per call
+SIGN_NAMES = np.array([s['name'] for s in ZODIAC_SIGNS])
+SIGN_RULERS = np.array([s['ruler'] for s in ZODIAC_SIGNS])
+SIGN_ELEMENTS = np.array([s['element'] for s in ZODIAC_SIGNS])
+SIGN_MODALITIES = np.array([s['modality'] for s in ZODIAC_SIGNS])
+
+
+def sign_indices(longitudes):
+    """Map ecliptic longitudes to zodiac sign indices, vectorized."""
+    return (np.asarray(longitudes).astype(np.int64) // 30) % 12
+
 
 def get_zodiac_sign(longitude):
-    """Convert ecliptic longitude to zodiac sign."""
+    """Convert a single ecliptic longitude to its zodiac sign (scalar fallback)."""
     sign_index = int(longitude / 30) % 12
     return ZODIAC_SIGNS[sign_index]
 
@@ -131,231 +178,245 @@ def check_aspect(lon1, lon2):
     return None
 
 
-def calculate_lunar_phase(sun_lon, moon_lon):
-    """Calculate detailed lunar phase."""
-    angle = normalize_angle(moon_lon - sun_lon)
-    illumination = (1 - np.cos(np.radians(angle))) / 2 * 100
-    
-    phases = [
-        (22.5, 'new'),
-        (67.5, 'waxing_crescent'),
-        (112.5, 'first_quarter'),
-        (157.5, 'waxing_gibbous'),
-        (202.5, 'full'),
-        (247.5, 'waning_gibbous'),
-        (292.5, 'last_quarter'),
-        (337.5, 'waning_crescent'),
-        (360, 'new')
-    ]
-    
-    phase = 'new'
-    for threshold, name in phases:
-        if angle < threshold:
-            phase = name
-            break
-    
-    return {
-        'phase': phase,
-        'illumination': round(illumination, 1),
-        'angle': round(angle, 2)
-    }
+PHASE_THRESHOLDS = np.array([22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5, 360.0])
+PHASE_NAMES = np.array(['new', 'waxing_crescent', 'first_quarter', 'waxing_gibbous',
+                        'full', 'waning_gibbous', 'last_quarter', 'waning_crescent', 'new'])
+
+
+def _illumination_kernel(angles):
+    return (1 - np.cos(np.radians(angles))) / 2 * 100
+
 
+if njit is not None:
+    _illumination_kernel = njit(cache=True)(_illumination_kernel)
 
-def calculate_lunar_cycle_phase(date):
+
+def calculate_lunar_phases(sun_lons, moon_lons):
+    """Calculate lunar phase, illumination and angle for every day at once."""
+    angles = normalize_angle(moon_lons - sun_lons)
+    illumination = np.round(_illumination_kernel(angles), 1)
+    phases = PHASE_NAMES[np.searchsorted(PHASE_THRESHOLDS, angles, side='right')]
+    return phases, illumination, np.round(angles, 2)
+
+
+# Key phases of the 18.6yr cycle (degree, name, description, orb)
+CYCLE_PHASE_DEG = np.array([0, 90, 137, 180, 223, 270, 360], dtype=np.float64)
+CYCLE_PHASE_ORB = np.array([2, 2, 3, 1, 3, 2, 1], dtype=np.float64)
+CYCLE_PHASE_NAMES = np.array([
+    'start', 'first_quadrature', 'fibonacci_38',
+    'opposition',  # MOST IMPORTANT
+    'fibonacci_61', 'second_quadrature',
+    'completion'  # MOST IMPORTANT
+])
+CYCLE_PHASE_DESC = np.array([
+    'Ascending Node - Cycle initiation', 'Interim volatility pivot',
+    'Minor reaction / harmonic pivot', 'Major volatility / turning point',
+    'Secondary reaction pivot', 'Intermediate volatility peak',
+    'Cycle reset / secular trend pivot'
+])
+CYCLE_BONUS_PHASES = frozenset(['opposition', 'completion', 'start'])
+
+
+def calculate_lunar_cycle_phases(dates, date_strs):
     """
-    Calculate 18.6-year lunar nodal cycle phase.
+    Calculate 18.6-year lunar nodal cycle phases for every date at once.
     Based on Louise McWhirter's principles.
-    Returns bonus-eligible status when within tight orb of major phases.
+    Returns rows only for dates within orb of a key phase; rows within
+    tight orb of the major phases are flagged bonus-eligible.
     """
     # Reference: J2000 epoch node position
     j2000_node = 125.04  # Mean longitude at J2000
     node_rate = -0.052954  # degrees per day (retrograde)
-    
-    days_since_j2000 = (date - datetime(2000, 1, 1)).days
-    current_node = normalize_angle(j2000_node + (node_rate * days_since_j2000))
-    
+
+    days = (np.array(dates, dtype='datetime64[D]')
+            - np.datetime64('2000-01-01', 'D')).astype(np.int64)
+    node_lons = normalize_angle(j2000_node + node_rate * days)
+
     # 18.6 year cycle = 6793.5 days
     cycle_length = 6793.5
-    cycle_position = (days_since_j2000 % cycle_length) / cycle_length * 360
-    
-    # Key phases of the 18.6yr cycle
-    cycle_phases = [
-        (0, 'start', 'Ascending Node - Cycle initiation', 2),
-        (90, 'first_quadrature', 'Interim volatility pivot', 2),
-        (137, 'fibonacci_38', 'Minor reaction / harmonic pivot', 3),
-        (180, 'opposition', 'Major volatility / turning point', 1),  # MOST IMPORTANT
-        (223, 'fibonacci_61', 'Secondary reaction pivot', 3),
-        (270, 'second_quadrature', 'Intermediate volatility peak', 2),
-        (360, 'completion', 'Cycle reset / secular trend pivot', 1)  # MOST IMPORTANT
-    ]
-    
-    phase_info = None
-    bonus_eligible = False
-    
-    for degree, phase_name, description, orb in cycle_phases:
-        diff = abs(cycle_position - degree)
-        if diff < orb:
-            phase_info = {
-                'phase': phase_name,
-                'description': description,
-                'orb': round(diff, 2),
+    cycle_days = days % cycle_length
+    cycle_position = cycle_days / cycle_length * 360
+
+    diff = np.abs(cycle_position[:, None] - CYCLE_PHASE_DEG[None, :])
+    hits = diff < CYCLE_PHASE_ORB[None, :]
+    day_sel = np.nonzero(hits.any(axis=1))[0]
+    phase_sel = np.argmax(hits[day_sel], axis=1)  # first phase within orb
+    orb_vals = diff[day_sel, phase_sel]
+    # Only tight orbs of the major phases qualify for bonus scoring
+    bonus = (orb_vals < 2) & np.isin(CYCLE_PHASE_NAMES[phase_sel],
+                                     list(CYCLE_BONUS_PHASES))
+
+    rows = []
+    for k, d in enumerate(day_sel):
+        p = phase_sel[k]
+        rows.append({
+            'date': date_strs[d],
+            'cycle_position': round(cycle_position[d], 2),
+            'node_longitude': round(node_lons[d], 2),
+            # Plain Python types: the dict is stringified into the CSV
+            # cell, and numpy 2 scalars repr as np.str_(...)/np.float64(...)
+            'key_phase': {
+                'phase': str(CYCLE_PHASE_NAMES[p]),
+                'description': str(CYCLE_PHASE_DESC[p]),
+                'orb': round(float(orb_vals[k]), 2),
                 'at_key_point': True
-            }
-            # Only tight orbs qualify for bonus scoring
-            bonus_eligible = diff < 2 and phase_name in ['opposition', 'completion', 'start']
-            break
-    
-    return {
-        'cycle_position': round(cycle_position, 2),
-        'node_longitude': round(current_node, 2),
-        'key_phase': phase_info,
-        'bonus_eligible': bonus_eligible,
-        'cycle_days_elapsed': int(days_since_j2000 % cycle_length)
-    }
-
-
-def get_planet_position(planet_code, jd):
-    """Get planet position using Swiss Ephemeris."""
-    result = swe.calc_ut(jd, planet_code)
-    longitude = result[0][0]
-    speed = result[0][3]
-    is_stationary = abs(speed) < 0.01  # Nearly stationary = stronger influence
-    return {
-        'longitude': round(longitude, 4),
-        'retrograde': speed < 0,
-        'stationary': is_stationary,
-        'speed': round(speed, 4),
-        'sign': get_zodiac_sign(longitude)
-    }
-
-
-def calculate_angles(jd, latitude=40.7128, longitude=-74.0060):
-    """Calculate MC, IC, ASC, DESC."""
-    # Use New York as default location (can be parameterized)
-    houses = swe.houses(jd, latitude, longitude, b'P')  # Placidus house system
-    
-    asc = houses[1][0]  # Ascendant
-    mc = houses[1][1]   # MC (Midheaven)
-    
-    return {
-        'ASC': {'longitude': round(asc, 4), 'sign': get_zodiac_sign(asc)},
-        'DESC': {'longitude': round((asc + 180) % 360, 4), 'sign': get_zodiac_sign((asc + 180) % 360)},
-        'MC': {'longitude': round(mc, 4), 'sign': get_zodiac_sign(mc)},
-        'IC': {'longitude': round((mc + 180) % 360, 4), 'sign': get_zodiac_sign((mc + 180) % 360)}
-    }
-
-
-def compute_daily_positions(date):
-    """Compute all planetary positions and events for a given date."""
-    jd = swe.julday(date.year, date.month, date.day, 12.0)  # Noon
-    
-    positions = {}
-    
-    # Primary planets
-    for name, code in PRIMARY_PLANETS.items():
-        positions[name] = get_planet_position(code, jd)
-    
-    # Outer planets (for supplemental bonus scoring)
-    for name, data in OUTER_PLANETS.items():
-        pos = get_planet_position(data['code'], jd)
-        pos['influence_weight'] = data['influence']
-        pos['bonus_eligible'] = pos['stationary']  # Only stationary outer planets count
-        positions[name] = pos
-    
-    # Chart points (for supplemental bonus scoring)
-    for name, data in CHART_POINTS.items():
-        pos = get_planet_position(data['code'], jd)
-        pos['influence_weight'] = data['influence']
-        positions[name] = pos
-    
-    # Angles (MC, IC, ASC, DESC)
-    angles = calculate_angles(jd)
-    for angle_name, angle_data in angles.items():
-        angle_data['influence_weight'] = ANGLES[angle_name]['influence']
-    positions.update(angles)
-    
-    return positions
-
+            },
+            'bonus_eligible': bool(bonus[k]),
+            'cycle_days_elapsed': int(cycle_days[d])
+        })
+    return rows
 
-def generate_aspects(positions, date, primary_only=True):
-    """Generate all aspects for the day."""
-    aspects = []
-    
-    bodies = list(PRIMARY_PLANETS.keys()) if primary_only else list(positions.keys())
-    
-    for i, body1 in enumerate(bodies):
-        for body2 in bodies[i+1:]:
-            if body1 in positions and body2 in positions:
-                lon1 = positions[body1]['longitude']
-                lon2 = positions[body2]['longitude']
-                aspect = check_aspect(lon1, lon2)
-                
-                if aspect:
-                    aspects.append({
-                        'date': date.strftime('%Y-%m-%d'),
-                        'body1': body1,
-                        'body2': body2,
-                        'aspect_type': aspect['type'],
-                        'aspect_nature': aspect['nature'],
-                        'orb': aspect['orb'],
-                        'exact': aspect['exact'],
-                        'body1_sign': positions[body1]['sign']['name'],
-                        'body2_sign': positions[body2]['sign']['name'],
-                        'primary_scoring': True
-                    })
-    
-    # Generate bonus aspects (outer planets with tight orbs only)
-    bonus_aspects = []
-    outer_bodies = list(OUTER_PLANETS.keys())
-    
-    for outer in outer_bodies:
-        if outer not in positions:
-            continue
-        for primary in PRIMARY_PLANETS.keys():
-            lon1 = positions[outer]['longitude']
-            lon2 = positions[primary]['longitude']
-            aspect = check_aspect(lon1, lon2)
-            
-            # Only exact aspects (<1° orb) qualify for bonus
-            if aspect and aspect['exact']:
-                bonus_aspects.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'body1': outer,
-                    'body2': primary,
-                    'aspect_type': aspect['type'],
-                    'aspect_nature': aspect['nature'],
-                    'orb': aspect['orb'],
-                    'exact': True,
-                    'body1_sign': positions[outer]['sign']['name'],
-                    'body2_sign': positions[primary]['sign']['name'],
-                    'primary_scoring': False,
-                    'bonus_eligible': True,
-                    'influence_weight': positions[outer]['influence_weight']
-                })
-    
-    return aspects + bonus_aspects
 
+def sweep_positions(jds, codes):
+    """Sweep swe.calc_ut over every (day, body) pair into NumPy buffers.
 
-def detect_ingresses(current_positions, previous_positions, date):
-    """Detect sign changes (ingresses)."""
-    ingresses = []
-    
-    for body in PRIMARY_PLANETS.keys():
-        if body in previous_positions:
-            curr_sign = current_positions[body]['sign']['name']
-            prev_sign = previous_positions[body]['sign']['name']
-            
-            if curr_sign != prev_sign:
-                ingresses.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'body': body,
-                    'sign': curr_sign,
-                    'from_sign': prev_sign,
-                    'ruler': current_positions[body]['sign']['ruler'],
-                    'element': current_positions[body]['sign']['element']
-                })
-    
-    return ingresses
+    One tight loop fills longitude and speed arrays of shape
+    (n_days, n_bodies); downstream math runs vectorized over the buffers
+    instead of rebuilding a dict per planet per day.
+    """
+    flags = swe.FLG_SWIEPH  # hoisted; avoids default-flag resolution per call
+    lons = np.empty((len(jds), len(codes)))
+    speeds = np.empty_like(lons)
+    for j, code in enumerate(codes):
+        for i, jd in enumerate(jds):
+            result = swe.calc_ut(jd, code, flags)
+            lons[i, j] = result[0][0]
+            speeds[i, j] = result[0][3]
+    # One bulk round replaces a round() per field per day
+    np.round(lons, 4, out=lons)
+    np.round(speeds, 4, out=speeds)
+    return lons, speeds
+
+
+def _aspect_hits(lons1, lons2, targets, orbs):
+    """Broadcast aspect matching between two longitude stacks.
+
+    Returns (found, aspect_idx, orb_diff) where found marks pairs within
+    orb of any aspect and aspect_idx picks the first matching aspect —
+    the same semantics as check_aspect's early return.
+    """
+    diff = np.abs(lons1[:, :, None] - lons2[:, None, :])
+    diff = np.minimum(diff, 360 - diff)
+    orb_diff = np.abs(diff[..., None] - targets)
+    hit = orb_diff <= orbs
+    aspect_idx = np.argmax(hit, axis=-1)
+    return hit.any(axis=-1), aspect_idx, orb_diff
+
+
+def generate_all_aspects(date_strs, body_names, lons):
+    """Generate primary and bonus aspects for the whole date range at once."""
+    sign_idx = sign_indices(lons)
+
+    n_primary = len(PRIMARY_PLANETS)
+    primary_names = body_names[:n_primary]
+    L = lons[:, :n_primary]
+
+    # Primary aspects: each unordered pair emitted once
+    found, aspect_idx, orb_diff = _aspect_hits(L, L, ASPECT_DEG, ASPECT_ORB)
+    iu, ju = np.triu_indices(n_primary, k=1)
+    day_idx, pair_idx = np.nonzero(found[:, iu, ju])
+    b1, b2 = iu[pair_idx], ju[pair_idx]
+    a_idx = aspect_idx[day_idx, b1, b2]
+    # exact compares the raw orb, matching check_aspect; rounding is
+    # display-only (an orb of 0.997 is exact even though it prints 1.0)
+    orb_raw = orb_diff[day_idx, b1, b2, a_idx]
+    orb_vals = np.round(orb_raw, 2)
+
+    date_arr = np.asarray(date_strs)
+    name_arr = np.array(primary_names)
+    primary_df = pd.DataFrame({
+        'date': date_arr[day_idx],
+        'body1': name_arr[b1],
+        'body2': name_arr[b2],
+        'aspect_type': ASPECT_NAME[a_idx],
+        'aspect_nature': ASPECT_NATURE[a_idx],
+        'orb': orb_vals,
+        'exact': orb_raw < 1,
+        'body1_sign': SIGN_NAMES[sign_idx[day_idx, b1]],
+        'body2_sign': SIGN_NAMES[sign_idx[day_idx, b2]],
+        'primary_scoring': True
+    })
+
+    # Bonus aspects: outer planets vs primaries, exact (<1° orb) only
+    outer_names = body_names[n_primary:n_primary + len(OUTER_PLANETS)]
+    outer_cols = np.arange(n_primary, n_primary + len(OUTER_PLANETS))
+    O = lons[:, outer_cols]
+
+    found_b, aspect_idx_b, orb_diff_b = _aspect_hits(O, L, ASPECT_DEG, ASPECT_ORB)
+    chosen_orb = np.take_along_axis(orb_diff_b, aspect_idx_b[..., None], axis=-1)[..., 0]
+    day_idx, o_idx, p_idx = np.nonzero(found_b & (chosen_orb < 1))
+    a_idx_b = aspect_idx_b[day_idx, o_idx, p_idx]
+    orb_vals_b = np.round(chosen_orb[day_idx, o_idx, p_idx], 2)
+
+    bonus_df = pd.DataFrame({
+        'date': date_arr[day_idx],
+        'body1': np.array(outer_names)[o_idx],
+        'body2': name_arr[p_idx],
+        'aspect_type': ASPECT_NAME[a_idx_b],
+        'aspect_nature': ASPECT_NATURE[a_idx_b],
+        'orb': orb_vals_b,
+        'exact': True,
+        'body1_sign': SIGN_NAMES[sign_idx[day_idx, outer_cols[o_idx]]],
+        'body2_sign': SIGN_NAMES[sign_idx[day_idx, p_idx]],
+        'primary_scoring': False,
+        'bonus_eligible': True,
+        'influence_weight': BODY_INFLUENCE[outer_cols[o_idx]]
+    })
+
+    return pd.concat([primary_df, bonus_df], ignore_index=True)
+
+
+def detect_all_ingresses(date_strs, body_names, sign_idx):
+    """Detect sign changes (ingresses) for the primary planets with one diff."""
+    idx = sign_idx[:, :len(PRIMARY_PLANETS)]
+    # Modular compare so the Pisces -> Aries (11 -> 0) wrap still registers
+    changes = np.diff(idx, axis=0) % 12 != 0
+    day_idx, planet_idx = np.nonzero(changes)
+
+    d = day_idx + 1  # ingress lands on the later day
+    signs = idx[d, planet_idx]
+    return pd.DataFrame({
+        'date': np.asarray(date_strs)[d],
+        'body': np.array(body_names[:len(PRIMARY_PLANETS)])[planet_idx],
+        'sign': SIGN_NAMES[signs],
+        'from_sign': SIGN_NAMES[idx[d - 1, planet_idx]],
+        'ruler': SIGN_RULERS[signs],
+        'element': SIGN_ELEMENTS[signs]
+    })
+
+
+def detect_retrograde_stations(date_strs, body_names, sign_idx, retro, stationary):
+    """Find retrograde start/end events with one diff over the daily flags.
+
+    Includes outer planets for bonus scoring; Sun and Moon are skipped
+    since they never station.
+    """
+    cols = np.arange(2, len(PRIMARY_PLANETS) + len(OUTER_PLANETS))
+    changes = np.diff(retro[:, cols].astype(np.int8), axis=0)
+    day_idx, col_idx = np.nonzero(changes)
+
+    d = day_idx + 1  # change lands on the later day
+    j = cols[col_idx]
+    is_outer = j >= len(PRIMARY_PLANETS)
+    is_stationary = stationary[d, j]
+
+    # Outer planets carry bonus columns; primaries leave them unset (NaN),
+    # matching the old row-dict shape
+    bonus_eligible = np.full(len(d), np.nan, dtype=object)
+    bonus_eligible[is_outer] = is_stationary[is_outer]
+    influence_weight = np.full(len(d), np.nan)
+    influence_weight[is_outer] = BODY_INFLUENCE[j[is_outer]]
+
+    return pd.DataFrame({
+        'date': np.asarray(date_strs)[d],
+        'body': np.array(body_names)[j],
+        'status': np.where(changes[day_idx, col_idx] == 1, 'starts', 'ends'),
+        'sign': SIGN_NAMES[sign_idx[d, j]],
+        'stationary': is_stationary,
+        'primary_scoring': ~is_outer,
+        'bonus_eligible': bonus_eligible,
+        'influence_weight': influence_weight
+    })
 
 
 def compute_solstices_equinoxes(year):
@@ -384,124 +445,92 @@ def compute_solstices_equinoxes(year):
     return seasonal_points
 
 
+def write_csv(df, path):
+    """Write a frame to CSV, preferring pyarrow's multithreaded writer."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        # pyarrow renders booleans as lowercase true/false, but
+        # dataProviders.js string-compares flags against pandas' "True",
+        # so boolean cells go out pre-rendered in pandas' spelling.
+        # Object columns keep NaN untouched (written as empty, as before).
+        df = df.copy(deep=False)
+        for col in df.columns:
+            if df[col].dtype == bool:
+                df[col] = np.where(df[col].to_numpy(), 'True', 'False')
+            elif df[col].dtype == object:
+                df[col] = df[col].map(
+                    lambda v: 'True' if v is True
+                    else 'False' if v is False else v)
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+    except Exception:
+        # pyarrow missing, or the frame holds nested columns it cannot write
+        df.to_csv(path, index=False)
+
+
 def main():
     print("🌟 Starting comprehensive astrological data computation...")
     print(f"📅 Date range: {START_DATE.date()} → {END_DATE.date()}")
     
-    # Storage
-    all_aspects = []
-    all_ingresses = []
-    all_lunar_phases = []
-    all_seasonal_points = []
-    all_retrogrades = []
-    all_lunar_cycle_phases = []
-    
-    # Compute seasonal points for all years
+    # Compute seasonal points for all years (one almanac search per year,
+    # independent across years, so spread them over the cores)
     print("\n🔆 Computing solstice/equinox anchor dates...")
-    for year in range(START_DATE.year, END_DATE.year + 1):
-        seasonal = compute_solstices_equinoxes(year)
-        all_seasonal_points.extend(seasonal)
+    years = range(START_DATE.year, END_DATE.year + 1)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        all_seasonal_points = list(itertools.chain.from_iterable(
+            executor.map(compute_solstices_equinoxes, years)))
     print(f"✅ Found {len(all_seasonal_points)} seasonal anchor points")
     
     # Daily computation
     print("\n📊 Processing daily planetary positions...")
-    current_date = START_DATE
-    previous_positions = None
-    previous_retrogrades = {}
-    
-    day_count = 0
-    
-    while current_date <= END_DATE:
-        positions = compute_daily_positions(current_date)
-        
-        # Aspects (primary planets only for scoring)
-        aspects = generate_aspects(positions, current_date, primary_only=True)
-        all_aspects.extend(aspects)
-        
-        # Ingresses
-        if previous_positions:
-            ingresses = detect_ingresses(positions, previous_positions, current_date)
-            all_ingresses.extend(ingresses)
-        
-        # Retrograde stations (including outer planets for bonus scoring)
-        all_bodies = {**PRIMARY_PLANETS, **{k: v['code'] for k, v in OUTER_PLANETS.items()}}
-        for body in list(all_bodies.keys())[2:]:  # Skip Sun and Moon
-            if body not in positions:
-                continue
-            is_rx = positions[body]['retrograde']
-            is_stationary = positions[body].get('stationary', False)
-            
-            if body in previous_retrogrades and previous_retrogrades[body] != is_rx:
-                retrograde_entry = {
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'body': body,
-                    'status': 'starts' if is_rx else 'ends',
-                    'sign': positions[body]['sign']['name'],
-                    'stationary': is_stationary
-                }
-                
-                # Mark outer planets as bonus-eligible when stationary
-                if body in OUTER_PLANETS:
-                    retrograde_entry['primary_scoring'] = False
-                    retrograde_entry['bonus_eligible'] = is_stationary
-                    retrograde_entry['influence_weight'] = OUTER_PLANETS[body]['influence']
-                else:
-                    retrograde_entry['primary_scoring'] = True
-                
-                all_retrogrades.append(retrograde_entry)
-            
-            previous_retrogrades[body] = is_rx
-        
-        # Lunar phase
-        lunar_phase = calculate_lunar_phase(
-            positions['Sun']['longitude'],
-            positions['Moon']['longitude']
-        )
-        all_lunar_phases.append({
-            'date': current_date.strftime('%Y-%m-%d'),
-            'phase': lunar_phase['phase'],
-            'illumination': lunar_phase['illumination'],
-            'sign': positions['Moon']['sign']['name'],
-            'ruler': positions['Moon']['sign']['ruler']
-        })
-        
-        # 18.6yr Lunar Cycle Phase
-        lunar_cycle = calculate_lunar_cycle_phase(current_date)
-        if lunar_cycle['key_phase']:  # Only store when near key points
-            all_lunar_cycle_phases.append({
-                'date': current_date.strftime('%Y-%m-%d'),
-                **lunar_cycle
-            })
-        
-        previous_positions = positions
-        day_count += 1
-        
-        if day_count % 365 == 0:
-            print(f"   Processed {day_count} days ({current_date.year})...")
-        
-        current_date += timedelta(days=1)
+    date_index = pd.date_range(START_DATE, END_DATE, freq='D')
+    dates = date_index.to_pydatetime()
+    date_strings = date_index.strftime('%Y-%m-%d').values  # one bulk strftime
+    # Closed-form Julian days at noon UT: JD 2451545.0 is 2000-01-01 12:00,
+    # so a whole-day offset lands exactly on swe.julday(y, m, d, 12.0)
+    jds = 2451545.0 + (date_index - pd.Timestamp('2000-01-01')).days.astype(np.float64)
+
+    lons, speeds = sweep_positions(jds, BODY_CODES)
+    sign_idx = sign_indices(lons)
+    retro = speeds < 0
+    stationary = np.abs(speeds) < 0.01  # Nearly stationary = stronger influence
+
+    # Lunar phases for the whole range in one vectorized pass
+    sun_lons = lons[:, BODY_IDX['Sun']]
+    moon_lons = lons[:, BODY_IDX['Moon']]
+    phase_names, illumination, _ = calculate_lunar_phases(sun_lons, moon_lons)
+
+    # Aspects for the whole range in one broadcast
+    all_aspects = generate_all_aspects(date_strings, BODY_NAMES, lons)
+
+    # 18.6yr lunar cycle key points, evaluated over all dates at once
+    all_lunar_cycle_phases = calculate_lunar_cycle_phases(dates, date_strings)
+
+    # Retrograde stations (including outer planets for bonus scoring)
+    all_retrogrades = detect_retrograde_stations(
+        date_strings, BODY_NAMES, sign_idx, retro, stationary)
+
+    # Ingresses for the whole range in one diff
+    all_ingresses = detect_all_ingresses(date_strings, BODY_NAMES, sign_idx)
+
+    moon_sign = sign_idx[:, BODY_IDX['Moon']]
+    all_lunar_phases = pd.DataFrame({
+        'date': date_strings,
+        'phase': phase_names,
+        'illumination': illumination,
+        'sign': SIGN_NAMES[moon_sign],
+        'ruler': SIGN_RULERS[moon_sign]
+    })
     
     # Save all data
     print("\n💾 Saving data files...")
     
-    pd.DataFrame(all_seasonal_points).to_csv(
-        OUTPUT_DIR / 'seasonal_anchors.csv', index=False
-    )
-    pd.DataFrame(all_aspects).to_csv(
-        OUTPUT_DIR / 'aspects.csv', index=False
-    )
-    pd.DataFrame(all_ingresses).to_csv(
-        OUTPUT_DIR / 'ingresses.csv', index=False
-    )
-    pd.DataFrame(all_lunar_phases).to_csv(
-        OUTPUT_DIR / 'lunar_phases.csv', index=False
-    )
-    pd.DataFrame(all_retrogrades).to_csv(
-        OUTPUT_DIR / 'retrogrades.csv', index=False
-    )
-    pd.DataFrame(all_lunar_cycle_phases).to_csv(
-        OUTPUT_DIR / 'lunar_cycle_18yr.csv', index=False
-    )
+    write_csv(pd.DataFrame(all_seasonal_points), OUTPUT_DIR / 'seasonal_anchors.csv')
+    write_csv(all_aspects, OUTPUT_DIR / 'aspects.csv')
+    write_csv(all_ingresses, OUTPUT_DIR / 'ingresses.csv')
+    write_csv(all_lunar_phases, OUTPUT_DIR / 'lunar_phases.csv')
+    write_csv(all_retrogrades, OUTPUT_DIR / 'retrogrades.csv')
+    write_csv(pd.DataFrame(all_lunar_cycle_phases), OUTPUT_DIR / 'lunar_cycle_18yr.csv')
     
     print("\n✅ Computation complete!")
     print(f"\n📋 Summary:")